@@ -1,4 +1,5 @@
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+import hashlib
 import os
 import sys
 import webbrowser
@@ -7,10 +8,11 @@ from pathlib import Path
 # Configuration
 PORT = 8000
 HTML_FILENAME = "youtube_looper.html"
+HASH_FILENAME = HTML_FILENAME + ".hash"
 
-def create_html_file():
-    """Create the HTML file with YouTube looper functionality"""
-    html_content = """<!DOCTYPE html>
+# The page is constant for the life of the process, so build the big
+# string (and its content hash) once at import time
+HTML_CONTENT = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -35,13 +37,30 @@ def create_html_file():
             padding-bottom: 56.25%; /* 16:9 Aspect Ratio */
             height: 0;
         }
-        .video-container iframe {
+        .video-container iframe,
+        .video-container #player {
             position: absolute;
             top: 0;
             left: 0;
             width: 100%;
             height: 100%;
         }
+        #player .poster {
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+            cursor: pointer;
+        }
+        #player .play {
+            position: absolute;
+            top: 50%;
+            left: 50%;
+            transform: translate(-50%, -50%);
+            width: 68px;
+            height: 48px;
+            font-size: 20px;
+            background-color: rgba(0, 0, 0, 0.7);
+        }
         .controls {
             display: flex;
             flex-wrap: wrap;
@@ -120,7 +139,10 @@ def create_html_file():
         </div>
         
         <div class="video-container">
-            <div id="player"></div>
+            <div id="player">
+                <img class="poster" src="https://i.ytimg.com/vi_webp/dQw4w9WgXcQ/hqdefault.webp" alt="Video thumbnail">
+                <button class="play" aria-label="Play">&#9658;</button>
+            </div>
         </div>
         
         <div class="controls">
@@ -150,18 +172,39 @@ def create_html_file():
         // YouTube API integration
         let player;
         let looping = false;
-        let loopInterval;
         let videoLoaded = false;
+        let loopStart = 0;
+        let loopEnd = 0;
+        let lastUI = 0;
+        let playerVisible = true;
+        let ticking = false;
+        let rafHandle = 0;
+        let timerHandle = 0;
+
+        // Cache the nodes touched every tick instead of re-querying them
+        const currentTimeEl = document.getElementById('current-time');
+        const progressSlider = document.getElementById('progress-slider');
         
-        // Load YouTube API
-        const tag = document.createElement('script');
-        tag.src = "https://www.youtube.com/iframe_api";
-        const firstScriptTag = document.getElementsByTagName('script')[0];
-        firstScriptTag.parentNode.insertBefore(tag, firstScriptTag);
-        
+        // Defer the YouTube player bundle until the user asks for a video.
+        // The iframe API tag is only injected on the first poster click or
+        // Load Video press; until then the page is just HTML and a thumbnail.
+        let apiRequested = false;
+        let pendingVideoId = null;
+
+        function requestPlayer(videoId) {
+            pendingVideoId = videoId;
+            if (apiRequested) return;
+            apiRequested = true;
+
+            const tag = document.createElement('script');
+            tag.src = "https://www.youtube.com/iframe_api";
+            const firstScriptTag = document.getElementsByTagName('script')[0];
+            firstScriptTag.parentNode.insertBefore(tag, firstScriptTag);
+        }
+
         // Initialize player when API is ready
         window.onYouTubeIframeAPIReady = function() {
-            const videoId = getVideoIdFromInput();
+            const videoId = pendingVideoId;
             player = new YT.Player('player', {
                 height: '100%',
                 width: '100%',
@@ -178,17 +221,20 @@ def create_html_file():
             });
         };
         
+        // Compiled once so repeated load attempts reuse the same automata
+        const YT_ID_RE = /^.*(youtu\.be\/|v\/|u\/\w\/|embed\/|watch\?v=|\&v=)([^#\&\?]*).*/;
+        const BARE_ID_RE = /^[^\/\.]{9,}$/;
+
         // Function to extract video ID from various YouTube URL formats
         function extractVideoId(url) {
             if (!url) return null;
-            
+
             // Check if it's already just an ID (no slashes or dots)
-            if (!/[\/\.]/.test(url) && url.length > 8) {
+            if (BARE_ID_RE.test(url)) {
                 return url;
             }
-            
-            const regExp = /^.*(youtu\.be\/|v\/|u\/\w\/|embed\/|watch\?v=|\&v=)([^#\&\?]*).*/;
-            const match = url.match(regExp);
+
+            const match = YT_ID_RE.exec(url);
             return (match && match[2].length === 11) ? match[2] : null;
         }
         
@@ -202,6 +248,8 @@ def create_html_file():
             updateVideoDuration();
             videoLoaded = true;
             document.getElementById('status').textContent = 'Video loaded';
+            // The player only exists because the user clicked, so start playback
+            event.target.playVideo();
             updatePlayPauseButton();
         }
         
@@ -228,55 +276,103 @@ def create_html_file():
             document.getElementById('end-time').value = duration.toFixed(1);
             
             // Update slider max value
-            document.getElementById('progress-slider').max = duration;
+            progressSlider.max = duration;
         }
         
         // Update current time display and slider
-        function updateTimeDisplay() {
-            if (!videoLoaded) return;
-            
-            const currentTime = player.getCurrentTime();
-            document.getElementById('current-time').textContent = formatTime(currentTime);
-            
+        function updateTimeDisplay(currentTime) {
+            currentTimeEl.textContent = formatTime(currentTime);
+
             // Update slider without triggering the input event
-            const slider = document.getElementById('progress-slider');
-            slider.value = currentTime;
+            progressSlider.value = currentTime;
         }
-        
+
+        // Single frame-aligned driver for the time display and the loop
+        // watcher. rAF stops firing in hidden tabs, so fall back to a
+        // coarse setTimeout there to keep the loop boundary check alive.
+        function tick(ts) {
+            if (!playerVisible && !looping) {
+                // Player is scrolled out of view and nothing needs the
+                // boundary check; the IntersectionObserver restarts us
+                ticking = false;
+                return;
+            }
+            if (videoLoaded) {
+                const currentTime = player.getCurrentTime();
+                // The loop boundary check is correctness-critical and runs
+                // every frame; the MM:SS readout only needs ~10Hz.
+                if (looping && currentTime >= loopEnd) {
+                    player.seekTo(loopStart);
+                }
+                if (ts - lastUI >= 100) {
+                    lastUI = ts;
+                    updateTimeDisplay(currentTime);
+                }
+            }
+            scheduleTick();
+        }
+
+        function scheduleTick() {
+            if (document.hidden) {
+                timerHandle = setTimeout(() => tick(performance.now()), 100);
+            } else {
+                rafHandle = requestAnimationFrame(tick);
+            }
+        }
+
+        function startTicking() {
+            if (ticking) return;
+            ticking = true;
+            scheduleTick();
+        }
+
+        // A pending rAF callback is frozen while the tab is hidden, so on
+        // hide the loop must move to the setTimeout chain (and back again
+        // on show). Cancel the old pending callback first or the frozen
+        // one fires on return and the loop doubles up.
+        document.addEventListener('visibilitychange', () => {
+            if (!ticking) return;
+            cancelAnimationFrame(rafHandle);
+            clearTimeout(timerHandle);
+            scheduleTick();
+        });
+
         // Start/stop the loop
         function toggleLoop() {
+            if (!videoLoaded) {
+                document.getElementById('status').textContent = 'Load a video before starting a loop';
+                return;
+            }
+
             const loopButton = document.getElementById('toggle-loop');
             
             if (looping) {
                 // Stop looping
-                clearInterval(loopInterval);
                 looping = false;
                 loopButton.textContent = 'Start Loop';
                 loopButton.classList.remove('active');
                 document.getElementById('status').textContent = 'Loop stopped';
             } else {
-                // Start looping
+                // Start looping: parse the inputs once so the tick loop
+                // reads plain numbers instead of hitting the DOM
                 const startTime = parseFloat(document.getElementById('start-time').value);
                 const endTime = parseFloat(document.getElementById('end-time').value);
-                
+
                 if (startTime >= endTime) {
                     document.getElementById('status').textContent = 'Error: Start time must be less than end time';
                     return;
                 }
-                
+
+                loopStart = startTime;
+                loopEnd = endTime;
+
                 player.seekTo(startTime);
                 player.playVideo();
-                
-                loopInterval = setInterval(() => {
-                    if (!videoLoaded) return;
-                    
-                    const currentTime = player.getCurrentTime();
-                    if (currentTime >= endTime) {
-                        player.seekTo(startTime);
-                    }
-                }, 100);
-                
+
                 looping = true;
+                // Ensure the boundary check runs even if the tick loop was
+                // parked while the player was off-screen
+                startTicking();
                 loopButton.textContent = 'Stop Loop';
                 loopButton.classList.add('active');
                 document.getElementById('status').textContent = `Looping from ${startTime}s to ${endTime}s`;
@@ -320,13 +416,20 @@ def create_html_file():
             if (looping) {
                 toggleLoop();
             }
-            
-            player.loadVideoById(videoId);
+
             document.getElementById('status').textContent = 'Loading video...';
-            
+
             // Reset time inputs
             document.getElementById('start-time').value = '0';
-            
+
+            // First load boots the deferred player; afterwards reuse it
+            if (!player) {
+                requestPlayer(videoId);
+                return;
+            }
+
+            player.loadVideoById(videoId);
+
             // Update duration after a slight delay to ensure video is loaded
             setTimeout(updateVideoDuration, 1000);
         }
@@ -337,38 +440,72 @@ def create_html_file():
             document.getElementById('toggle-loop').addEventListener('click', toggleLoop);
             document.getElementById('play-pause').addEventListener('click', togglePlayPause);
             document.getElementById('load-video').addEventListener('click', loadVideo);
-            
+
+            // First click on the poster boots the real player
+            document.getElementById('player').addEventListener('click', () => {
+                if (!player) requestPlayer(getVideoIdFromInput());
+            });
+
             // Set up progress slider
-            const slider = document.getElementById('progress-slider');
-            slider.addEventListener('input', () => {
+            progressSlider.addEventListener('input', () => {
                 if (!videoLoaded) return;
-                player.seekTo(parseFloat(slider.value));
+                player.seekTo(parseFloat(progressSlider.value));
             });
             
-            // Update time display every 100ms
-            setInterval(updateTimeDisplay, 100);
+            // Park the tick loop while the player is scrolled out of view;
+            // it has nothing visible to update unless a loop is running
+            const observer = new IntersectionObserver((entries) => {
+                playerVisible = entries[0].isIntersecting;
+                if (playerVisible) startTicking();
+            });
+            observer.observe(document.querySelector('.video-container'));
+
+            // Drive the time display and loop watcher from animation frames
+            startTicking();
         });
     </script>
 </body>
 </html>"""
-    
-    with open(HTML_FILENAME, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
-    return Path(HTML_FILENAME).absolute()
+
+# Pre-encode once so writing the file is a single raw binary write
+HTML_BYTES = HTML_CONTENT.encode('utf-8')
+HTML_HASH = hashlib.blake2b(HTML_BYTES, digest_size=16).hexdigest()
+
+def create_html_file():
+    """Create the HTML file with YouTube looper functionality"""
+    target = Path(HTML_FILENAME)
+    hash_file = Path(HASH_FILENAME)
+
+    # Skip the rewrite when the on-disk copy already matches the template
+    if target.exists() and hash_file.exists() and hash_file.read_text() == HTML_HASH:
+        return target.absolute()
+
+    with open(HTML_FILENAME, 'wb') as f:
+        f.write(HTML_BYTES)
+    hash_file.write_text(HTML_HASH)
+
+    return target.absolute()
 
 class CustomHTTPRequestHandler(SimpleHTTPRequestHandler):
+    # Keep-alive lets the browser fetch every asset over one socket
+    # instead of paying a TCP handshake per request
+    protocol_version = "HTTP/1.1"
+
     def end_headers(self):
         # Add CORS headers for local development
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET')
-        self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate')
+        # Only the HTML needs to stay fresh; let other assets cache
+        if self.path == '/' or self.path.endswith('.html'):
+            self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate')
         super().end_headers()
 
 def start_server():
     """Start a simple HTTP server"""
     server_address = ('', PORT)
-    httpd = HTTPServer(server_address, CustomHTTPRequestHandler)
+    httpd = ThreadingHTTPServer(server_address, CustomHTTPRequestHandler)
+    # Don't let in-flight handler threads hold up Ctrl+C shutdown
+    httpd.daemon_threads = True
     print(f"Server running at http://localhost:{PORT}/")
     print(f"YouTube Looper available at http://localhost:{PORT}/{HTML_FILENAME}")
     print("Press Ctrl+C to stop the server")
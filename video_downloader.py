@@ -1,64 +1,113 @@
 import sys
 import os
 import re
-import yt_dlp
+import time
 import argparse
-from tqdm import tqdm
 
 class VideoDownloader:
+    # Metadata cache shared across instances: url -> (fetch time, info dict).
+    # Saves a round trip to the site's metadata endpoint on repeat downloads.
+    _META_CACHE_TTL = 86400
+    _meta_cache = {}
+
     def __init__(self, output_dir="downloads"):
         """Initialize the video downloader with an output directory."""
         self.output_dir = output_dir
-        
+        self._last_progress_ts = 0.0
+
         # Create the output directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-    
-    def extract_video(self, url):
-        """Download a video from the given URL."""
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Configuration options for yt-dlp
+        self._ydl_opts = {
+            'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',  # Get best quality
+            'outtmpl': os.path.join(self.output_dir, '%(title)s.%(ext)s'),  # Output file template
+            'restrictfilenames': True,  # Restrict filenames to ASCII characters
+            'noplaylist': True,  # Download only the video if URL refers to a playlist
+            'progress_hooks': [self._progress_hook],  # Display download progress
+            'merge_output_format': 'mp4',  # Merge video and audio into mp4
+            'http_headers': {'Connection': 'keep-alive'},  # Reuse connections across fragment fetches
+            'socket_timeout': 30,  # Don't hang forever on a dead connection
+            'concurrent_fragment_downloads': 8,  # Fetch HLS/DASH fragments in parallel
+            'retries': 3,
+            'fragment_retries': 3,
+        }
+
+        # The shared yt-dlp instance, created lazily on first download so
+        # importing/constructing it doesn't slow down --help and bad-URL
+        # exits (the import alone loads every extractor)
+        self._ydl = None
+
+    def _get_ydl(self):
+        """Create the shared YoutubeDL instance on first use."""
+        if self._ydl is None:
+            import yt_dlp
+            self._ydl = yt_dlp.YoutubeDL(self._ydl_opts)
+        return self._ydl
+
+    def extract_video(self, url, ignore_cache=False):
+        """Download a video from the given URL.
+
+        Pass ignore_cache=True to force a fresh metadata fetch instead of
+        reusing a cached result.
+        """
         try:
-            # Configuration options for yt-dlp
-            ydl_opts = {
-                'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',  # Get best quality
-                'outtmpl': os.path.join(self.output_dir, '%(title)s.%(ext)s'),  # Output file template
-                'restrictfilenames': True,  # Restrict filenames to ASCII characters
-                'noplaylist': True,  # Download only the video if URL refers to a playlist
-                'progress_hooks': [self._progress_hook],  # Display download progress
-                'merge_output_format': 'mp4',  # Merge video and audio into mp4
-            }
-            
             print(f"Extracting video from: {url}")
-            
-            # Create a yt-dlp instance with our options
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # Extract video info before downloading
-                info_dict = ydl.extract_info(url, download=False)
-                video_title = info_dict.get('title', 'video')
-                
-                print(f"Title: {video_title}")
-                print(f"Duration: {self._format_duration(info_dict.get('duration', 0))}")
-                print(f"Resolution: {info_dict.get('width', 'unknown')}x{info_dict.get('height', 'unknown')}")
-                
-                # Download the video
-                ydl.download([url])
-                
-                # Return path to downloaded file
-                filename = ydl.prepare_filename(info_dict)
-                return filename
-                
+
+            ydl = self._get_ydl()
+
+            # Extract video info before downloading
+            info_dict = self._get_video_info(ydl, url, ignore_cache)
+            video_title = info_dict.get('title', 'video')
+
+            print(f"Title: {video_title}")
+            print(f"Duration: {self._format_duration(info_dict.get('duration', 0))}")
+            print(f"Resolution: {info_dict.get('width', 'unknown')}x{info_dict.get('height', 'unknown')}")
+
+            # Download the video
+            ydl.download([url])
+
+            # Return path to downloaded file
+            filename = ydl.prepare_filename(info_dict)
+            return filename
+
         except Exception as e:
             print(f"Error downloading video: {str(e)}")
             return None
-    
+
+    def _get_video_info(self, ydl, url, ignore_cache=False):
+        """Fetch video metadata, reusing a cached result when still fresh."""
+        if not ignore_cache:
+            cached = self._meta_cache.get(url)
+            if cached and time.monotonic() - cached[0] < self._META_CACHE_TTL:
+                return cached[1]
+
+        info_dict = ydl.extract_info(url, download=False)
+        self._meta_cache[url] = (time.monotonic(), info_dict)
+        return info_dict
+
+    @classmethod
+    def clear_metadata_cache(cls):
+        """Drop all cached video metadata."""
+        cls._meta_cache.clear()
+
     def _progress_hook(self, d):
-        """Display download progress."""
+        """Display download progress, throttled to ~10 updates per second."""
         if d['status'] == 'downloading':
+            # yt-dlp can fire this dozens of times per second; redrawing
+            # the line that often just burns CPU in the terminal
+            now = time.monotonic()
+            if now - self._last_progress_ts < 0.1:
+                return
+            self._last_progress_ts = now
+
             # Display a simple progress indicator
             percent = d.get('_percent_str', 'unknown')
             speed = d.get('_speed_str', 'unknown speed')
             eta = d.get('_eta_str', 'unknown ETA')
-            print(f"\rDownloading... {percent} at {speed}, ETA: {eta}", end='')
-        
+            sys.stdout.write(f"\rDownloading... {percent} at {speed}, ETA: {eta}")
+            sys.stdout.flush()
+
         elif d['status'] == 'finished':
             print("\nDownload complete! Converting format...")
     
@@ -66,43 +115,30 @@ class VideoDownloader:
         """Format seconds into HH:MM:SS."""
         if not seconds:
             return "unknown"
-        
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        seconds = seconds % 60
-        
+
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+
         if hours > 0:
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
+            return f"{hours}:{minutes:02d}:{secs:02d}"
         else:
-            return f"{minutes}:{seconds:02d}"
+            return f"{minutes}:{secs:02d}"
+
+
+# Known video domains plus direct video-file extensions, folded into one
+# compiled pattern so validation is a single scan
+_URL_RE = re.compile(
+    r'(?:youtube\.com|youtu\.be|vimeo\.com|dailymotion\.com'
+    r'|facebook\.com/watch|twitch\.tv|tiktok\.com|instagram\.com'
+    r'|twitter\.com|x\.com)'
+    r'|\.(?:mp4|avi|mov|wmv|flv|mkv|webm)$',
+    re.IGNORECASE,
+)
 
 
 def validate_url(url):
     """Validate that the URL has a common video domain or appears to be a video URL."""
-    video_domains = [
-        'youtube.com', 'youtu.be', 
-        'vimeo.com', 
-        'dailymotion.com', 
-        'facebook.com/watch', 
-        'twitch.tv',
-        'tiktok.com',
-        'instagram.com',
-        'twitter.com', 'x.com'
-    ]
-    
-    # Check if the URL contains a known video domain
-    for domain in video_domains:
-        if domain in url:
-            return True
-    
-    # Check if the URL appears to be a video file
-    video_extensions = ['.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv', '.webm']
-    for ext in video_extensions:
-        if url.endswith(ext):
-            return True
-    
-    # If we're not sure, we'll let yt-dlp try anyway
-    return True
+    return bool(_URL_RE.search(url))
 
 
 def main():
@@ -8,7 +8,14 @@ class VideoDownloader:
     """
     Python wrapper for the VideoDownloader C++ library
     """
-    
+
+    # Built once; creating a CFUNCTYPE type allocates a libffi closure
+    # template, which is too expensive to repeat per download
+    _PROGRESS_CB_T = ctypes.CFUNCTYPE(None, ctypes.c_double)
+
+    # Library version, decoded once when the first instance loads the lib
+    _VERSION: Optional[str] = None
+
     def __init__(self):
         """
         Initialize the VideoDownloader wrapper and load the native library
@@ -38,7 +45,13 @@ class VideoDownloader:
         
         # Create a new instance of the C++ VideoDownloader
         self._downloader = self._lib.VideoDownloader_Create()
-        
+
+        # Cache the version string on the class so get_version never has
+        # to round-trip into the library again
+        if VideoDownloader._VERSION is None:
+            version = self._lib.VideoDownloader_GetVersion()
+            VideoDownloader._VERSION = version.decode('utf-8') if version else ""
+
     def _define_function_prototypes(self):
         """
         Define the function prototypes for the C++ library functions
@@ -46,7 +59,8 @@ class VideoDownloader:
         # Create/destroy instance
         self._lib.VideoDownloader_Create.restype = ctypes.c_void_p
         self._lib.VideoDownloader_Destroy.argtypes = [ctypes.c_void_p]
-        
+        self._lib.VideoDownloader_Destroy.restype = None
+
         # Download video
         self._lib.VideoDownloader_DownloadVideo.argtypes = [
             ctypes.c_void_p,
@@ -59,22 +73,34 @@ class VideoDownloader:
         
         # Get available formats
         self._lib.VideoDownloader_GetAvailableFormats.argtypes = [
-            ctypes.c_void_p, 
-            ctypes.c_char_p, 
-            ctypes.POINTER(ctypes.c_char_p), 
+            ctypes.c_void_p,
+            ctypes.c_char_p,
+            ctypes.POINTER(ctypes.c_char_p),
             ctypes.POINTER(ctypes.c_int)
         ]
-        
+        self._lib.VideoDownloader_GetAvailableFormats.restype = None
+
+        # Free the format list allocated by GetAvailableFormats. Without
+        # explicit argtypes ctypes would marshal the pointer as a c_int,
+        # truncating it on 64-bit platforms.
+        self._lib.VideoDownloader_FreeFormats.argtypes = [
+            ctypes.POINTER(ctypes.c_char_p),
+            ctypes.c_int
+        ]
+        self._lib.VideoDownloader_FreeFormats.restype = None
+
         # Set format/quality
         self._lib.VideoDownloader_SetPreferredFormat.argtypes = [
-            ctypes.c_void_p, 
+            ctypes.c_void_p,
             ctypes.c_char_p
         ]
+        self._lib.VideoDownloader_SetPreferredFormat.restype = None
         self._lib.VideoDownloader_SetPreferredQuality.argtypes = [
-            ctypes.c_void_p, 
+            ctypes.c_void_p,
             ctypes.c_char_p
         ]
-        
+        self._lib.VideoDownloader_SetPreferredQuality.restype = None
+
         # Get last error
         self._lib.VideoDownloader_GetLastError.argtypes = [ctypes.c_void_p]
         self._lib.VideoDownloader_GetLastError.restype = ctypes.c_char_p
@@ -102,24 +128,21 @@ class VideoDownloader:
         Returns:
             bool: True if download was successful, False otherwise
         """
-        # Progress callback handling with ctypes
-        callback_func = None
-        if progress_callback:
-            PROGRESS_CALLBACK = ctypes.CFUNCTYPE(None, ctypes.c_double)
-            
-            def callback_wrapper(progress):
-                progress_callback(progress)
-                
-            callback_func = PROGRESS_CALLBACK(callback_wrapper)
-        
+        # Keep the ctypes trampoline alive on self for the duration of the
+        # C call; if it were only a local, the GC could collect it while
+        # the C code still holds the function pointer and segfault
+        self._active_cb = (
+            self._PROGRESS_CB_T(progress_callback) if progress_callback else None
+        )
+
         result = self._lib.VideoDownloader_DownloadVideo(
             self._downloader,
             url.encode('utf-8'),
             output_path.encode('utf-8'),
-            callback_func,
+            self._active_cb,
             None  # User data pointer, not needed for this wrapper
         )
-        
+
         return result
         
     def get_available_formats(self, url: str) -> List[str]:
@@ -142,12 +165,17 @@ class VideoDownloader:
             ctypes.byref(count)
         )
         
-        # Convert C string array to Python list
-        formats = []
-        for i in range(count.value):
-            format_str = formats_ptr[i].decode('utf-8')
-            formats.append(format_str)
-            
+        # Convert the C string array with one cast to a sized array type
+        # instead of a pointer dereference per entry
+        if count.value:
+            arr = ctypes.cast(
+                formats_ptr,
+                ctypes.POINTER(ctypes.c_char_p * count.value)
+            ).contents
+            formats = [s.decode('utf-8') for s in arr]
+        else:
+            formats = []
+
         # Free memory allocated by C++
         self._lib.VideoDownloader_FreeFormats(formats_ptr, count)
         
@@ -187,16 +215,16 @@ class VideoDownloader:
         error_msg = self._lib.VideoDownloader_GetLastError(self._downloader)
         return error_msg.decode('utf-8') if error_msg else ""
         
-    @staticmethod
-    def get_version() -> str:
+    @classmethod
+    def get_version(cls) -> Optional[str]:
         """
         Get library version
-        
+
         Returns:
-            str: Version string
+            Optional[str]: Version string, or None if no instance has
+            loaded the library yet
         """
-        version = VideoDownloader._lib.VideoDownloader_GetVersion()
-        return version.decode('utf-8')
+        return cls._VERSION
 
 
 # Example usage